@@ -1,6 +1,10 @@
 import sys
 import os
 import sqlite3
+import atexit
+import bisect
+import functools
+import threading
 
 from PySide6.QtWidgets import (
     QApplication, QWidget, QLabel, QPushButton,
@@ -8,116 +12,182 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtGui import QMovie
 from PySide6.QtCore import Qt, QSize, QPoint
-from PySide6.QtCore import QPropertyAnimation
+from PySide6.QtCore import QPropertyAnimation, QAbstractAnimation
 from PySide6.QtWidgets import QGraphicsOpacityEffect
 from PySide6.QtCore import QEasingCurve
+from PySide6.QtCore import (
+    QObject, QRunnable, QThreadPool, QMutex, QMutexLocker, QTimer, Signal
+)
 from PySide6.QtWidgets import QSizePolicy
 
 
 SAVINGS_GOAL = 500  # change this anytime
+MAX_AMOUNT_DIGITS = 9  # keeps a single entry within a sane int size
+
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
+@functools.lru_cache(maxsize=None)
 def get_db_path() -> str:
     """Return absolute path to db/bloomgarden.db"""
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    return os.path.join(base_dir, "db", "bloomgarden.db")
+    return os.path.join(_BASE_DIR, "db", "bloomgarden.db")
+
+
+_SQL_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000;
+    PRAGMA mmap_size=67108864;
+"""
+# savings is the append-only history (used by undo); balance holds the
+# running total in a single row so reads never scan the history
+_SQL_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS savings (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        amount INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS balance (
+        id INTEGER PRIMARY KEY CHECK (id = 0),
+        total INTEGER NOT NULL
+    ) WITHOUT ROWID;
+    INSERT INTO balance (id, total)
+        SELECT 0, (SELECT COALESCE(SUM(amount), 0) FROM savings)
+        WHERE NOT EXISTS (SELECT 1 FROM balance);
+"""
+
+# SQL kept as constants so the connection's statement cache always hits
+_SQL_INSERT = "INSERT INTO savings (amount) VALUES (?)"
+_SQL_TOTAL = "SELECT total FROM balance WHERE id = 0"
+_SQL_BALANCE_ADD = "UPDATE balance SET total = total + ? WHERE id = 0"
+_SQL_BALANCE_RESET = "UPDATE balance SET total = 0 WHERE id = 0"
+_SQL_HAS_ROWS = "SELECT EXISTS(SELECT 1 FROM savings)"
+_SQL_UNDO_LAST = (
+    "DELETE FROM savings WHERE id = (SELECT MAX(id) FROM savings) RETURNING amount"
+)
+_SQL_DELETE_ALL = "DELETE FROM savings"
 
+_conn = None
+_write_mutex = QMutex()  # SQLite allows a single writer at a time
 
-def init_db():
-    """Create savings table if it doesn't exist."""
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
-    cur = conn.cursor()
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS savings (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            amount INTEGER NOT NULL
-        )
-    """)
-    conn.commit()
-    conn.close()
-
-
-def is_goal_reached() -> bool:
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
-    cur = conn.cursor()
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS app_state (
-            key TEXT PRIMARY KEY,
-            value TEXT
+
+def _get_conn() -> sqlite3.Connection:
+    """Return the shared connection, opening it on first use."""
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(
+            get_db_path(), check_same_thread=False, cached_statements=128
         )
-    """)
-    cur.execute("SELECT value FROM app_state WHERE key='goal_reached'")
-    row = cur.fetchone()
-    conn.close()
-    return row is not None and row[0] == "true"
-
-
-def set_goal_reached():
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
-    cur = conn.cursor()
-    cur.execute("""
-        INSERT OR REPLACE INTO app_state (key, value)
-        VALUES ('goal_reached', 'true')
-    """)
-    conn.commit()
-    conn.close()
-
-
-def add_savings(amount: int):
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
-    cur = conn.cursor()
-    cur.execute(
-        "INSERT INTO savings (amount) VALUES (?)",
-        (amount,)
-    )
-    last_id = cur.lastrowid
-    conn.commit()
-    conn.close()
-    return last_id
-    
+    return _conn
+
+
+atexit.register(lambda: _conn and _conn.close())
+
+
+def init_db():
+    """Apply connection PRAGMAs and create the schema in one script."""
+    script = _SQL_SCHEMA
+    # tuned once on the shared connection, later statements inherit them
+    if not get_db_path().endswith(":memory:"):
+        script = _SQL_PRAGMAS + script
+    _get_conn().executescript(script)
+
+
+def add_savings(amounts: list[int]):
+    """Insert a batch of entries with a single commit."""
+    with QMutexLocker(_write_mutex):
+        conn = _get_conn()
+        # commits on success, rolls back history + balance together on error
+        with conn:
+            conn.executemany(_SQL_INSERT, [(a,) for a in amounts])
+            conn.execute(_SQL_BALANCE_ADD, (sum(amounts),))
+
 
 def get_total_savings() -> int:
-    """Return sum of all savings entries."""
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
-    cur = conn.cursor()
-    cur.execute("SELECT COALESCE(SUM(amount), 0) FROM savings")
-    total = cur.fetchone()[0]
-    conn.close()
+    """Return the current savings balance."""
+    total = _get_conn().execute(_SQL_TOTAL).fetchone()[0]
     return int(total)
 
-def delete_saving_row(row_id: int):
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
-    cur = conn.cursor()
-    cur.execute("DELETE FROM savings WHERE id = ?", (row_id,))
-    conn.commit()
-    conn.close()
+
+def has_savings() -> bool:
+    """Return whether any savings entries exist."""
+    return bool(_get_conn().execute(_SQL_HAS_ROWS).fetchone()[0])
+
+
+def read_savings_state() -> tuple[int, bool]:
+    """Return (balance, whether entries exist) as currently committed."""
+    return get_total_savings(), has_savings()
+
+
+def undo_last():
+    """Delete the newest savings entry.
+
+    Return (deleted amount or None if empty, whether entries remain).
+    """
+    with QMutexLocker(_write_mutex):
+        conn = _get_conn()
+        with conn:
+            cur = conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            row = cur.execute(_SQL_UNDO_LAST).fetchone()
+            if row:
+                cur.execute(_SQL_BALANCE_ADD, (-row[0],))
+        remaining = has_savings()
+    return (row[0] if row else None), remaining
+
+
+def reset_savings():
+    with QMutexLocker(_write_mutex):
+        conn = _get_conn()
+        with conn:
+            cur = conn.cursor()
+            cur.execute(_SQL_DELETE_ALL)
+            cur.execute(_SQL_BALANCE_RESET)
+
+
+class _WriteSignals(QObject):
+    finished = Signal(object, object, object)  # (worker, result, error)
+
+
+class DbWriteWorker(QRunnable):
+    """Run a DB write helper on the thread pool, off the GUI thread."""
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = _WriteSignals()
+
+    def run(self):
+        # always report back, so the GUI can drop the worker and react
+        try:
+            result = self.fn(*self.args)
+        except Exception as exc:
+            self.signals.finished.emit(self, None, exc)
+            return
+        self.signals.finished.emit(self, result, None)
+
+
+# first total (integer) reaching each stage; ceil so e.g. 125/500 is "small"
+_STAGE_THRESHOLDS = [
+    -(-SAVINGS_GOAL // 4),
+    -(-SAVINGS_GOAL // 2),
+    -(-3 * SAVINGS_GOAL // 4),
+    SAVINGS_GOAL,
+]
+_STAGE_NAMES = ("seed", "small", "growing", "almost", "bloom")
 
 
 def get_plant_stage(total: int) -> str:
     """Pick stage name based on progress."""
-    progress = total / SAVINGS_GOAL if SAVINGS_GOAL > 0 else 0
-
-    if progress < 0.25:
+    if SAVINGS_GOAL <= 0:
         return "seed"
-    elif progress < 0.5:
-        return "small"
-    elif progress < 0.75:
-        return "growing"
-    elif progress < 1.0:
-        return "almost"
-    else:
-        return "bloom"
+    return _STAGE_NAMES[bisect.bisect_right(_STAGE_THRESHOLDS, total)]
 
 
+@functools.lru_cache(maxsize=None)
 def get_plant_image_path(stage: str) -> str:
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    return os.path.join(base_dir, "assets", "plant", f"{stage}.gif")
+    return os.path.join(_BASE_DIR, "assets", "plant", f"{stage}.gif")
 
 
 def get_motivational_message(stage: str) -> str:
@@ -131,6 +201,130 @@ def get_motivational_message(stage: str) -> str:
     return messages.get(stage, "")
 
 
+# 🎨 Stylesheets, defined once and shared by every widget/dialog
+_WINDOW_CSS = """
+    QWidget {
+        background-color: #F5F7F4;
+        font-family: Segoe UI;
+    }
+"""
+
+_PROGRESS_CSS = """
+    QProgressBar {
+        background-color: #E6EFEA;
+        border-radius: 7px;
+    }
+    QProgressBar::chunk {
+        background-color: #9FBEA1;
+        border-radius: 7px;
+    }
+"""
+
+_STATUS_CSS = "font-size: 15px; color: #4F6F6F; font-weight: 500;"
+
+_MOTIVATION_CSS = """
+    QLabel {
+        font-size: 14px;
+        color: #6B8E8E;
+        line-height: 22px;
+    }
+"""
+
+_INPUT_CSS = """
+    QLineEdit {
+        background-color: #FFFFFF;
+        color: #2E4F4F;              /* typed text color */
+        border: 1px solid #C7D6D5;
+        border-radius: 10px;
+        padding: 10px;
+        font-size: 15px;
+    }
+
+    QLineEdit::placeholder {
+        color: #9AA6A5;              /* placeholder text */
+    }
+"""
+
+_ADD_BTN_CSS = """
+    QPushButton {
+        background-color: #A7C7A5;
+        color: white;
+        font-size: 16px;
+        font-weight: bold;
+        border-radius: 12px;
+        padding: 12px;
+    }
+    QPushButton:hover {
+        background-color: #93B893;
+    }
+"""
+
+_SUBTRACT_BTN_CSS = """
+    QPushButton {
+        background-color: #E6B8B7;
+        color: white;
+        font-size: 16px;
+        font-weight: bold;
+        border-radius: 12px;
+        padding: 12px;
+    }
+    QPushButton:hover {
+        background-color: #D99A99;
+    }
+"""
+
+_RESET_BTN_CSS = """
+    QPushButton {
+        background-color: transparent;
+        color: #888888;
+        font-size: 13px;
+        border: none;
+    }
+    QPushButton:hover {
+        color: #555555;
+        text-decoration: underline;
+    }
+"""
+
+_UNDO_BTN_CSS = """
+    QPushButton {
+        background-color: #EEE;
+        color: #555;
+        border-radius: 8px;
+    }
+    QPushButton:hover {
+        background-color: #DDD;
+    }
+"""
+
+_CARD_CSS = """
+    QWidget {
+        background-color: white;
+        border-radius: 24px;
+    }
+"""
+
+_MSGBOX_CSS = """
+    QMessageBox {
+        background-color: #F9FBFA;
+    }
+    QLabel {
+        color: #2E4F4F;
+        font-size: 14px;
+    }
+    QPushButton {
+        background-color: #A7C7A5;
+        color: white;
+        border-radius: 6px;
+        padding: 6px 14px;
+        min-width: 80px;
+    }
+    QPushButton:hover {
+        background-color: #93B893;
+    }
+"""
+
+
 class BloomGardenApp(QWidget):
     def __init__(self):
         super().__init__()
@@ -140,12 +334,7 @@ class BloomGardenApp(QWidget):
         self.setMinimumSize(480, 600)
 
         # 🌸 Main background
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #F5F7F4;
-                font-family: Segoe UI;
-            }
-        """)
+        self.setStyleSheet(_WINDOW_CSS)
 
 
         self.image_label = QLabel()
@@ -162,34 +351,19 @@ class BloomGardenApp(QWidget):
         self.progress_bar.setRange(0, SAVINGS_GOAL)
         self.progress_bar.setTextVisible(False)
         self.progress_bar.setFixedHeight(8)
-        self.progress_bar.setStyleSheet("""
-         QProgressBar {
-            background-color: #E6EFEA;
-            border-radius: 7px;
-        }
-        QProgressBar::chunk {
-             background-color: #9FBEA1;
-             border-radius: 7px;
-         }
-        """)
+        self.progress_bar.setStyleSheet(_PROGRESS_CSS)
 
 
         self.status_label = QLabel()
         self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setStyleSheet("font-size: 15px; color: #4F6F6F; font-weight: 500;")
+        self.status_label.setStyleSheet(_STATUS_CSS)
 
         self.motivation_label = QLabel()
         self.motivation_label.setAlignment(Qt.AlignCenter)
         self.motivation_label.setWordWrap(True)
         self.motivation_label.setFixedWidth(260)
 
-        self.motivation_label.setStyleSheet("""
-           QLabel {
-              font-size: 14px;
-              color: #6B8E8E;
-              line-height: 22px;
-            }
-        """)
+        self.motivation_label.setStyleSheet(_MOTIVATION_CSS)
 
         self.motivation_opacity = QGraphicsOpacityEffect()
         self.motivation_label.setGraphicsEffect(self.motivation_opacity)
@@ -199,37 +373,12 @@ class BloomGardenApp(QWidget):
         self.input_box = QLineEdit()
         self.input_box.setPlaceholderText("Enter savings amount (e.g., 50)")
         self.input_box.setFixedHeight(40)
-        self.input_box.setStyleSheet("""
-           QLineEdit {
-               background-color: #FFFFFF;
-               color: #2E4F4F;              /* typed text color */
-               border: 1px solid #C7D6D5;
-             border-radius: 10px;
-             padding: 10px;
-             font-size: 15px;
-             }
-
-             QLineEdit::placeholder {
-                color: #9AA6A5;              /* placeholder text */
-              }
-         """)
+        self.input_box.setStyleSheet(_INPUT_CSS)
 
         #add button
         self.add_button = QPushButton("➕ Add Savings")
         self.add_button.setFixedHeight(45)
-        self.add_button.setStyleSheet("""
-            QPushButton {
-                background-color: #A7C7A5;
-                color: white;
-                font-size: 16px;
-                font-weight: bold;
-                border-radius: 12px;
-                padding: 12px;
-            }
-            QPushButton:hover {
-                background-color: #93B893;
-            }
-        """)
+        self.add_button.setStyleSheet(_ADD_BTN_CSS)
         self.add_button.clicked.connect(self.handle_add_savings)
 
         self.add_button.pressed.connect(
@@ -242,19 +391,7 @@ class BloomGardenApp(QWidget):
         #subtract button
         self.subtract_button = QPushButton("➖ Subtract Savings")
         self.subtract_button.setFixedHeight(45)
-        self.subtract_button.setStyleSheet("""
-             QPushButton {
-                 background-color: #E6B8B7;
-                 color: white;
-                 font-size: 16px;
-                 font-weight: bold;
-                 border-radius: 12px;
-                 padding: 12px;
-             }
-             QPushButton:hover {
-                background-color: #D99A99;
-             }
-        """)
+        self.subtract_button.setStyleSheet(_SUBTRACT_BTN_CSS)
         self.subtract_button.clicked.connect(self.handle_subtract_savings)
 
         self.subtract_button.pressed.connect(
@@ -268,44 +405,19 @@ class BloomGardenApp(QWidget):
         #Reset Button
         self.reset_button = QPushButton("🔄 Reset (Test)")
         self.reset_button.setFixedHeight(35)
-        self.reset_button.setStyleSheet("""
-             QPushButton {
-                 background-color: transparent;
-                 color: #888888;
-                 font-size: 13px;
-                 border: none;
-             }
-             QPushButton:hover {
-                 color: #555555;
-                 text-decoration: underline;
-             }
-        """)
+        self.reset_button.setStyleSheet(_RESET_BTN_CSS)
         self.reset_button.clicked.connect(self.handle_reset_savings)
         
         #undo button
         self.undo_button = QPushButton("↩ Undo Last Action")
         self.undo_button.setFixedHeight(36)
-        self.undo_button.setStyleSheet("""
-             QPushButton {
-               background-color: #EEE;
-               color: #555;
-               border-radius: 8px;
-             }
-             QPushButton:hover {
-             background-color: #DDD;
-             }
-        """)
+        self.undo_button.setStyleSheet(_UNDO_BTN_CSS)
         self.undo_button.clicked.connect(self.handle_undo)
 
 
 # 🌼 Card container
         card = QWidget()
-        card.setStyleSheet("""
-            QWidget {
-                background-color: white;
-                border-radius: 24px;
-            }
-        """)
+        card.setStyleSheet(_CARD_CSS)
         card.setFixedWidth(360)
 
         card_layout = QVBoxLayout(card)
@@ -359,53 +471,119 @@ class BloomGardenApp(QWidget):
 
 # initialize animation state
         self.last_progress_value = 0
-        self.last_action_id = None
+        self.movie = None
+        self._movie_cache: dict[str, QMovie] = {}
+        self._current_stage = None
+        self._last_total = None
+        self._last_goal_state = None
+        # running total: read once at startup, then updated per action
+        self._total = get_total_savings()
+        # celebration is UI state: only play it when the goal is crossed live
+        self._celebrated = self._total >= SAVINGS_GOAL
+        # kept in memory like _total so refresh_ui never waits on the writer
+        self._has_rows = has_savings()
+        self._resyncing = False
+        self._workers = {}  # in-flight writes -> completion callback
+        # one writer thread so queued writes commit in click order
+        self._write_pool = QThreadPool(self)
+        self._write_pool.setMaxThreadCount(1)
+
+        # 🧺 coalesce rapid adds/subtracts into one commit
+        self._pending: list[int] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(200)
+        self._flush_timer.timeout.connect(self.flush_pending)
+
+        # 🎬 one animation per (widget, property), retargeted on each use
+        self._progress_anim = QPropertyAnimation(self.progress_bar, b"value", self)
+        self._progress_anim.setEasingCurve(QEasingCurve.OutCubic)
+
+        self.fade_out = QPropertyAnimation(self.opacity_effect, b"opacity", self)
+        self.fade_out.setDuration(200)
+        self.fade_out.setStartValue(1.0)
+        self.fade_out.setEndValue(0.0)
+        self.fade_out.finished.connect(self.swap_movie)
+
+        self.fade_in = QPropertyAnimation(self.opacity_effect, b"opacity", self)
+        self.fade_in.setDuration(300)
+        self.fade_in.setStartValue(0.0)
+        self.fade_in.setEndValue(1.0)
+        self._previous_movie = None
+
+        self._motivation_fade_out = QPropertyAnimation(
+          self.motivation_opacity, b"opacity", self
+        )
+        self._motivation_fade_out.setDuration(150)
+        self._motivation_fade_out.setStartValue(1.0)
+        self._motivation_fade_out.setEndValue(0.0)
+        self._motivation_fade_out.finished.connect(self.show_motivation_text)
+
+        self._motivation_fade_in = QPropertyAnimation(
+          self.motivation_opacity, b"opacity", self
+        )
+        self._motivation_fade_in.setDuration(250)
+        self._motivation_fade_in.setStartValue(0.0)
+        self._motivation_fade_in.setEndValue(1.0)
+        self._motivation_text = ""
+
+        self._celebration_anim = QPropertyAnimation(self.image_label, b"geometry", self)
+        self._celebration_anim.setDuration(600)
+        self._celebration_anim.setEasingCurve(QEasingCurve.OutBounce)
+
+        for button in (self.add_button, self.subtract_button):
+          button._press_anim = QPropertyAnimation(button, b"geometry", button)
+          button._press_anim.setDuration(120)
+          button._press_anim.setEasingCurve(QEasingCurve.OutQuad)
+
+          button._release_anim = QPropertyAnimation(button, b"geometry", button)
+          button._release_anim.setDuration(160)
+          button._release_anim.setEasingCurve(QEasingCurve.OutBounce)
 
 
 # initialize view
         self.show()
-        QApplication.processEvents()  # 🔹 FORCE layout to settle
-        self.refresh_ui()
+        QTimer.singleShot(0, self.refresh_ui)  # 🔹 after layout has settled
 
 
 
     
     def refresh_ui(self):
-        if hasattr(self, "movie") and self.movie:
-         self.movie.stop()
+        total = self._total
+        self.undo_button.setEnabled(self._has_rows)
+
+        # ⏭ Nothing changed since last refresh -> skip the animation work
+        if total == self._last_total:
+          return
+        self._last_total = total
 
-        total = get_total_savings()
         stage = get_plant_stage(total)
-        img_path = get_plant_image_path(stage)
+        goal_reached = total >= SAVINGS_GOAL
 
-        # 🎯 Different heights per stage (fix overlap)
-        if stage in ["seed", "small"]:
-            self.image_label.setFixedSize(260, 180)
-        elif stage == "growing":
-            self.image_label.setFixedSize(260, 200)
-        elif stage == "almost":
-            self.image_label.setFixedSize(260, 220)
-        else:  # bloom
-            self.image_label.setFixedSize(260, 240)
+        if goal_reached and not self._celebrated:
+         self._celebrated = True
+         self.play_celebration()
 
+        # only touch what actually changed since the last refresh
+        self._update_progress(total)
 
-        """print("Stage:", stage)
-        print("GIF path:", img_path)
-        print("GIF exists:", os.path.exists(img_path))
-        """
-        new_value = min(total, SAVINGS_GOAL)
+        if stage != self._current_stage:
+          self._update_stage(stage)
 
-        goal_already_reached = is_goal_reached()
+        self.status_label.setText(
+          f"🌱 Savings: {total} / {SAVINGS_GOAL}  |  Stage: {stage}"
+        )
 
-        if total >= SAVINGS_GOAL and not goal_already_reached:
-         set_goal_reached()
-         self.play_celebration()
+        if goal_reached != self._last_goal_state:
+          self._update_buttons(goal_reached)
 
+    def _update_progress(self, total: int):
+        new_value = min(total, SAVINGS_GOAL)
+        if new_value == self.last_progress_value:
+          return
 
         delta = abs(new_value - self.last_progress_value)
 
-        self.progress_anim = QPropertyAnimation(self.progress_bar, b"value")
-
       # 🎚 Dynamic duration (big jumps feel heavier)
         if delta < 50:
          duration = 300
@@ -414,29 +592,40 @@ class BloomGardenApp(QWidget):
         else:
          duration = 600
 
-        self.progress_anim.setDuration(duration)
-
-     # 🌿 Natural easing (smooth + premium feel)
-        self.progress_anim.setEasingCurve(QEasingCurve.OutCubic)
-
-        self.progress_anim.setStartValue(self.last_progress_value)
-        self.progress_anim.setEndValue(new_value)
-        self.progress_anim.start()
+        self._progress_anim.stop()
+        self._progress_anim.setDuration(duration)
+        self._progress_anim.setStartValue(self.last_progress_value)
+        self._progress_anim.setEndValue(new_value)
+        self._progress_anim.start()
 
         self.last_progress_value = new_value
 
+    def _update_stage(self, stage: str):
+        self._current_stage = stage
 
-        self.animate_motivation_text(get_motivational_message(stage))
+        # 🎯 Different heights per stage (fix overlap)
+        if stage in ["seed", "small"]:
+            self.image_label.setFixedSize(260, 180)
+        elif stage == "growing":
+            self.image_label.setFixedSize(260, 200)
+        elif stage == "almost":
+            self.image_label.setFixedSize(260, 220)
+        else:  # bloom
+            self.image_label.setFixedSize(260, 240)
 
+        self.animate_motivation_text(get_motivational_message(stage))
 
         self.image_label.setMinimumSize(240, 180)
         self.image_label.setMaximumSize(260, 200)
 
-        self.movie = QMovie(img_path)
-        self.movie.setScaledSize(self.image_label.size())
-        self.movie.setScaledSize(QSize(240, 180))
+        # 🎞 Decode each stage's GIF once, reuse it afterwards
+        movie = self._movie_cache.get(stage)
+        if movie is None:
+          movie = QMovie(get_plant_image_path(stage))
+          movie.setScaledSize(QSize(240, 180))
+          self._movie_cache[stage] = movie
 
-        if not self.movie.isValid():
+        if not movie.isValid():
           self.image_label.setText("❌ GIF failed to load")
           self.image_label.setStyleSheet("color: red;")
           return
@@ -444,39 +633,18 @@ class BloomGardenApp(QWidget):
         self.image_label.setStyleSheet("")
         self.image_label.setAlignment(Qt.AlignBottom | Qt.AlignHCenter)
 
-# Fade out
-        self.fade_out = QPropertyAnimation(self.opacity_effect, b"opacity")
-        self.fade_out.setDuration(200)
-        self.fade_out.setStartValue(1.0)
-        self.fade_out.setEndValue(0.0)
-
-# Fade in
-        self.fade_in = QPropertyAnimation(self.opacity_effect, b"opacity")
-        self.fade_in.setDuration(300)
-        self.fade_in.setStartValue(0.0)
-        self.fade_in.setEndValue(1.0)
-
-        #def swap_movie():
-        #    self.image_label.setMovie(self.movie)
-        #    self.movie.setScaledSize(QSize(260, 220))
-        #    self.movie.start()
-        #   self.fade_in.start()
-
-        def swap_movie():
-             self.image_label.setMovie(self.movie)
-             self.movie.start()
-             self.fade_in.start()
-
+        if self._previous_movie is None:
+          self._previous_movie = self.movie
+        self.movie = movie
 
-        self.fade_out.finished.connect(swap_movie)
+        self.fade_in.stop()
+        self.fade_out.stop()
         self.fade_out.start()
 
-        self.status_label.setText(
-          f"🌱 Savings: {total} / {SAVINGS_GOAL}  |  Stage: {stage}"
-        )
-
+    def _update_buttons(self, goal_reached: bool):
+        self._last_goal_state = goal_reached
 
-        if total >= SAVINGS_GOAL:
+        if goal_reached:
          self.add_button.setEnabled(False)
          self.add_button.setText("🌸 Goal Reached!")
         else:
@@ -486,44 +654,56 @@ class BloomGardenApp(QWidget):
       # Subtract must ALWAYS work
          self.subtract_button.setEnabled(True)
 
+    def swap_movie(self):
+        if self._previous_movie is not None:
+         self._previous_movie.stop()
+         self._previous_movie = None
+        self.image_label.setMovie(self.movie)
+        self.movie.start()
+        self.fade_in.start()
+
     def play_celebration(self):
         self.status_label.setText("🌸 You did it! Goal achieved!")
 
-        anim = QPropertyAnimation(self.image_label, b"geometry")
-        anim.setDuration(600)
-        anim.setEasingCurve(QEasingCurve.OutBounce)
+        anim = self._celebration_anim
+        anim.stop()
 
         rect = self.image_label.geometry()
         anim.setStartValue(rect.adjusted(-10, -10, 10, 10))
         anim.setEndValue(rect)
 
         anim.start()
-        self._celebration_anim = anim
 
 
     def animate_button_press(self, button: QPushButton):
-        anim = QPropertyAnimation(button, b"geometry")
-        anim.setDuration(120)
-        anim.setEasingCurve(QEasingCurve.OutQuad)
+        # still bouncing from the last click -> skip, so rapid clicks
+        # don't pile up animations or read a mid-animation geometry
+        if (button._press_anim.state() == QAbstractAnimation.Running
+                or button._release_anim.state() == QAbstractAnimation.Running):
+            return
+
+        anim = button._press_anim
 
         rect = button.geometry()
+        button._rest_rect = rect
         anim.setStartValue(rect)
         anim.setEndValue(rect.adjusted(3, 3, -3, -3))
 
         anim.start()
-        button._press_anim = anim  # keep reference
 
     def animate_button_release(self, button: QPushButton):
-        anim = QPropertyAnimation(button, b"geometry")
-        anim.setDuration(160)
-        anim.setEasingCurve(QEasingCurve.OutBounce)
+        rect = getattr(button, "_rest_rect", None)
+        if rect is None:  # the matching press was skipped
+            return
+        button._rest_rect = None
 
-        rect = button.geometry()
-        anim.setStartValue(rect.adjusted(3, 3, -3, -3))
+        button._press_anim.stop()
+        anim = button._release_anim
+
+        anim.setStartValue(button.geometry())
         anim.setEndValue(rect)
 
         anim.start()
-        button._release_anim = anim
 
 
     def handle_add_savings(self):
@@ -535,18 +715,22 @@ class BloomGardenApp(QWidget):
            return
 
 
-        try:
-          amount = int(text)
-        except ValueError:
+        # ascii check: isdigit() alone also accepts digits int() rejects (e.g. "²")
+        if not (text.isascii() and text.isdigit()):
            self.show_warning("Oops!", "Please enter a whole number like 50 or 200.")
            self.shake_widget(self.input_box)
            return
+        if len(text) > MAX_AMOUNT_DIGITS:
+           self.show_warning("Oops!", "That amount is too large, try a smaller one.")
+           self.shake_widget(self.input_box)
+           return
+        amount = int(text)
 
         if amount <= 0:
            self.show_warning("Oops!", "Amount must be greater than 0.")
            self.shake_widget(self.input_box)
            return
-        if get_total_savings() >= SAVINGS_GOAL:
+        if self._total >= SAVINGS_GOAL:
            self.show_warning(
              "Goal already reached 🌸",
              "You’ve already reached your savings goal!"
@@ -555,10 +739,9 @@ class BloomGardenApp(QWidget):
            self.input_box.clear()
            return
 
-        self.last_action_id = add_savings(amount)
-
         self.input_box.clear()
-        self.refresh_ui()
+        self._total += amount
+        self.queue_savings(amount)
 
 
 
@@ -570,17 +753,22 @@ class BloomGardenApp(QWidget):
           self.shake_widget(self.input_box)
           return
 
-        try:
-          amount = int(text)
-        except ValueError:
+        if not (text.isascii() and text.isdigit()):
           self.show_warning("Oops!", "Please enter a whole number like 50.")
+          self.shake_widget(self.input_box)
+          return
+        if len(text) > MAX_AMOUNT_DIGITS:
+          self.show_warning("Oops!", "That amount is too large, try a smaller one.")
+          self.shake_widget(self.input_box)
           return
+        amount = int(text)
 
         if amount <= 0:
           self.show_warning("Oops!", "Amount must be greater than 0.")
+          self.shake_widget(self.input_box)
           return
 
-        current_total = get_total_savings()
+        current_total = self._total
 
     # 🚫 Prevent going below zero
         if amount > current_total:
@@ -593,9 +781,63 @@ class BloomGardenApp(QWidget):
            return
 
 
-        self.last_action_id = add_savings(-amount)
-
         self.input_box.clear()
+        self._total -= amount
+        self.queue_savings(-amount)
+
+    def queue_savings(self, amount: int):
+        self._pending.append(amount)
+        self._has_rows = True
+        self._flush_timer.start()
+        self.refresh_ui()
+
+    def flush_pending(self):
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+
+        amounts, self._pending = self._pending, []
+        self.run_write(self.on_write_done, add_savings, amounts)
+
+    def run_write(self, on_done, fn, *args):
+        worker = DbWriteWorker(fn, *args)
+        self._workers[worker] = on_done
+
+        # bound slot on a GUI-thread QObject -> delivered on the GUI thread
+        worker.signals.finished.connect(self.on_write_finished)
+        self._write_pool.start(worker)
+
+    def on_write_finished(self, worker, result, error):
+        on_done = self._workers.pop(worker, None)
+        if error is not None:
+            self.on_write_failed(error)
+        elif on_done is not None:
+            on_done(result)
+
+    def on_write_failed(self, error):
+        self.show_warning(
+          "Couldn't save 💭",
+          f"Your last change wasn't saved: {error}"
+        )
+        if self._resyncing:  # the re-read itself failed, don't loop
+          self._resyncing = False
+          self.refresh_ui()
+          return
+
+        # _total was updated optimistically; re-read what was really saved.
+        # queued on the writer so it runs after every earlier write
+        self._resyncing = True
+        self.run_write(self.on_resync_done, read_savings_state)
+
+    def on_resync_done(self, state):
+        self._resyncing = False
+        total, has_rows = state
+        # entries still buffered in _pending haven't been written yet
+        self._total = total + sum(self._pending)
+        self._has_rows = has_rows or bool(self._pending)
+        self.refresh_ui()
+
+    def on_write_done(self, _result):
         self.refresh_ui()
 
     
@@ -612,82 +854,70 @@ class BloomGardenApp(QWidget):
          yes_btn = msg.addButton("Yes", QMessageBox.YesRole)
          no_btn = msg.addButton("No", QMessageBox.NoRole)
 
-         msg.setStyleSheet("""
-          QMessageBox {
-           background-color: #F9FBFA;
-         }
-          QLabel {
-           color: #2E4F4F;
-           font-size: 14px;
-         }
-          QPushButton {
-           background-color: #A7C7A5;
-           color: white;
-           border-radius: 6px;
-           padding: 6px 14px;
-           min-width: 80px;
-         }
-          QPushButton:hover {
-           background-color: #93B893;
-         }
-        """)
+         msg.setStyleSheet(_MSGBOX_CSS)
 
          msg.exec()
 
          if msg.clickedButton() == yes_btn:
-          db_path = get_db_path()
-          conn = sqlite3.connect(db_path)
-          cur = conn.cursor()
-          cur.execute("DELETE FROM savings")
-          conn.commit()
-          conn.close()
-
-          self.refresh_ui()
+          self._flush_timer.stop()
+          self._pending = []
+          self._total = 0
+          self._has_rows = False
+          self.run_write(self.on_write_done, reset_savings)
 
     def handle_undo(self):
-         if self.last_action_id is None:
+         self.flush_pending()
+         self.run_write(self.on_undo_done, undo_last)
+
+    def on_undo_done(self, result):
+         amount, remaining = result
+         # an entry queued while the undo ran still counts as undoable
+         self._has_rows = remaining or bool(self._pending)
+         if amount is None:
           self.show_warning("Nothing to undo", "No recent action to undo.")
-          return
-
-         delete_saving_row(self.last_action_id)
-         self.last_action_id = None
+         else:
+          self._total -= amount
          self.refresh_ui()
     
 
+    def hideEvent(self, event):
+         # no point decoding GIF frames nobody can see
+         if self.movie:
+          self.movie.setPaused(True)
+         super().hideEvent(event)
+
+    def showEvent(self, event):
+         if self.movie:
+          self.movie.setPaused(False)
+         super().showEvent(event)
+
+    def closeEvent(self, event):
+         self.flush_pending()
+         self._write_pool.waitForDone()
+         super().closeEvent(event)
+
+
     def show_warning(self, title: str, message: str):
          msg = QMessageBox(self)
          msg.setIcon(QMessageBox.Warning)
          msg.setWindowTitle(title)
          msg.setText(message)
 
-         msg.setStyleSheet("""
-          QMessageBox {
-            background-color: #F9FBFA;
-          }
-          QLabel {
-            color: #2E4F4F;
-            font-size: 14px;
-          }
-          QPushButton {
-            background-color: #A7C7A5;
-            color: white;
-            border-radius: 6px;
-            padding: 6px 14px;
-            min-width: 80px;
-          }
-          QPushButton:hover {
-            background-color: #93B893;
-          }
-        """)
+         msg.setStyleSheet(_MSGBOX_CSS)
 
          msg.exec()
 
 
     def shake_widget(self, widget):
-        start = widget.pos()
+        anim = getattr(widget, "_shake_anim", None)
+        if anim is not None and anim.state() == QAbstractAnimation.Running:
+          return  # let the current shake finish, restarting would drift pos
+        if anim is None:
+          anim = QPropertyAnimation(widget, b"pos", widget)
+          anim.setDuration(300)
+          widget._shake_anim = anim  # created once, reused per shake
 
-        anim = QPropertyAnimation(widget, b"pos")
-        anim.setDuration(300)
+        start = widget.pos()
         anim.setKeyValueAt(0.0, start)
         anim.setKeyValueAt(0.25, start + QPoint(-6, 0))
         anim.setKeyValueAt(0.5, start + QPoint(6, 0))
@@ -695,37 +925,38 @@ class BloomGardenApp(QWidget):
         anim.setKeyValueAt(1.0, start)
 
         anim.start()
-        widget._shake_anim = anim  # keep reference
 
 
     def animate_motivation_text(self, new_text: str):
-       fade_out = QPropertyAnimation(self.motivation_opacity, b"opacity")
-       fade_out.setDuration(150)
-       fade_out.setStartValue(1.0)
-       fade_out.setEndValue(0.0)
-
-       def update_text():
-        self.motivation_label.setText(new_text)
+       self._motivation_text = new_text
 
-        fade_in = QPropertyAnimation(self.motivation_opacity, b"opacity")
-        fade_in.setDuration(250)
-        fade_in.setStartValue(0.0)
-        fade_in.setEndValue(1.0)
-        fade_in.start()
+       self._motivation_fade_in.stop()
+       self._motivation_fade_out.stop()
+       self._motivation_fade_out.start()
 
-        self._motivation_fade_in = fade_in
+    def show_motivation_text(self):
+       self.motivation_label.setText(self._motivation_text)
+       self._motivation_fade_in.start()
 
-       fade_out.finished.connect(update_text)
-       fade_out.start()
 
-       self._motivation_fade_out = fade_out
 
+if __name__ == "__main__":
+    # open/recover the DB while Qt loads its platform plugins
+    db_errors = []
 
+    def run_init_db():
+        try:
+            init_db()
+        except Exception as exc:
+            db_errors.append(exc)
 
-if __name__ == "__main__":
-    init_db()
+    db_thread = threading.Thread(target=run_init_db, daemon=True)
+    db_thread.start()
 
     app = QApplication(sys.argv)
+    db_thread.join()  # the window reads the total on construction
+    if db_errors:
+        raise db_errors[0]  # fail fast with the real cause
     window = BloomGardenApp()
     window.show()
     sys.exit(app.exec())